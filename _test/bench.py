@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+import threading
+from time import monotonic, sleep
+import requests
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+API_DIR = os.path.join(TEST_DIR, "..", "api")
+# Checkout da versão antiga da api/ para comparar (ex.: `git worktree add /tmp/baseline <commit>`)
+BASELINE_API_DIR = os.getenv("BASELINE_API_DIR")
+# Com BENCH_MONGOMOCK=1 a API sobe com um Mongo em memória (ver mongomock_shim.py)
+USE_MONGOMOCK = os.getenv("BENCH_MONGOMOCK") == "1"
+BASE_URL = "http://127.0.0.1:8000"
+READY_TIMEOUT = float(os.getenv("BENCH_READY_TIMEOUT", "60"))
+
+UVICORN = ["uvicorn", "run:app", "--host", "127.0.0.1", "--port", "8000"]
+GUNICORN = ["gunicorn", "-c", "gunicorn.conf.py", "--bind", "127.0.0.1:8000", "run:app"]
+
+# modo -> (comando, diretório, tem /ready)
+MODES = {
+    "baseline": (UVICORN, BASELINE_API_DIR, False),
+    "single": (UVICORN, API_DIR, True),
+    "multi": (GUNICORN, API_DIR, True),
+}
+
+# (método, path, body) medidos em cada modo
+SCENARIOS = [
+    ("GET", "/age-groups", None),
+    ("POST", "/enroll", {"name": "Bench", "cpf": "00000000000", "age": 30}),
+]
+
+
+def wait_for(path, started_at, timeout):
+    while monotonic() - started_at < timeout:
+        try:
+            if requests.get(f"{BASE_URL}{path}", timeout=1).status_code == 200:
+                return monotonic() - started_at
+        except requests.RequestException:
+            pass
+        sleep(0.01)
+    return None
+
+
+def seed_age_groups():
+    # Num mongod real o banco pode estar vazio; o shim já sobe com age groups
+    if requests.get(f"{BASE_URL}/age-groups", timeout=5).json()["age_groups"]:
+        return
+    token = requests.post(f"{BASE_URL}/auth/login", json={"username": "admin", "password": "admin"}, timeout=5).json()["token"]
+    requests.post(
+        f"{BASE_URL}/age-groups",
+        json={"min_age": 0, "max_age": 120, "description": "Bench"},
+        headers={"X-Token": token},
+        timeout=5,
+    )
+
+
+def measure_rps(method, path, body, duration, threads):
+    count = [0] * threads
+    errors = [0] * threads
+    deadline = monotonic() + duration
+
+    def worker(i):
+        session = requests.Session()
+        while monotonic() < deadline:
+            try:
+                ok = session.request(method, f"{BASE_URL}{path}", json=body, timeout=5).status_code == 200
+            except requests.RequestException:
+                ok = False
+            if ok:
+                count[i] += 1
+            else:
+                errors[i] += 1
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return sum(count) / duration, sum(errors)
+
+
+def _seconds(value):
+    return f"{value:.2f}s" if value is not None else "n/a"
+
+
+def run():
+    # Uso: python bench.py [baseline|single|multi|all] [segundos] [threads]
+    mode = sys.argv[1] if len(sys.argv) > 1 else "all"
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+
+    modes = list(MODES) if mode == "all" else [mode]
+    for name in modes:
+        command, cwd, has_ready = MODES[name]
+        if cwd is None:
+            print(f"{name}: ignorado (defina BASELINE_API_DIR)")
+            continue
+        if USE_MONGOMOCK:
+            command = [sys.executable, os.path.join(TEST_DIR, "mongomock_shim.py")] + command
+        started_at = monotonic()
+        process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            # listening: primeira 200 em `/`; ready: primeira 200 em `/ready` (a versão
+            # antiga não tem); first query: primeira 200 em `/age-groups`, que lê do Mongo
+            listening = wait_for("/", started_at, READY_TIMEOUT)
+            ready = wait_for("/ready", started_at, READY_TIMEOUT) if has_ready and listening else None
+            first_query = wait_for("/age-groups", started_at, READY_TIMEOUT) if listening else None
+            print(f"{name}: listening {_seconds(listening)}, ready {_seconds(ready)}, first query {_seconds(first_query)}")
+            if first_query is None:
+                continue
+            seed_age_groups()
+            for method, path, body in SCENARIOS:
+                rps, errors = measure_rps(method, path, body, duration, threads)
+                print(f"{name}: {rps:.0f} req/s em {method} {path} ({errors} erros)")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    run()
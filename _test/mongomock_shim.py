@@ -0,0 +1,43 @@
+import sys
+import mongomock
+from mongomock.store import ServerStore
+import pymongo
+
+# Sobe a API com um Mongo em memória (mongomock), para rodar o bench.py onde não há
+# mongod disponível. Uso: python mongomock_shim.py uvicorn|gunicorn <args...>
+# Cada processo tem seu próprio banco: com gunicorn, cada worker herda do master
+# uma cópia já com os age groups abaixo e não vê os writes dos outros workers.
+
+AGE_GROUPS = [
+    {"min_age": 0, "max_age": 12, "description": "Child"},
+    {"min_age": 13, "max_age": 19, "description": "Teen"},
+    {"min_age": 20, "max_age": 60, "description": "Adult"},
+    {"min_age": 61, "max_age": 120, "description": "Senior"},
+]
+
+_store = ServerStore()
+
+
+class SharedStoreClient(mongomock.MongoClient):
+    # Todos os clientes do processo enxergam o mesmo banco, como num mongod real
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, _store=_store, **kwargs)
+
+
+def run():
+    pymongo.MongoClient = SharedStoreClient
+    SharedStoreClient()["enrollDatabase"]["ageGroupCollection"].insert_many(AGE_GROUPS)
+
+    sys.argv = sys.argv[1:]
+    if sys.argv[0] == "gunicorn":
+        from gunicorn.app.wsgiapp import run as gunicorn_run
+
+        gunicorn_run()
+    else:
+        import uvicorn
+
+        uvicorn.main()
+
+
+if __name__ == "__main__":
+    run()
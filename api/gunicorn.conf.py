@@ -0,0 +1,57 @@
+import math
+import multiprocessing
+import os
+
+# Launcher de produção: `gunicorn -c gunicorn.conf.py run:app`
+
+
+def _available_cpus() -> int:
+    # CPUs que o processo pode usar (cpuset do container), não os do host
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = multiprocessing.cpu_count()
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(cpus, 1)
+
+
+def _cgroup_cpu_quota():
+    # Limite de CPU do container (ex.: `docker run --cpus 2`), ou None se não houver
+    try:
+        # cgroup v2: "<quota> <período>" ou "max <período>"
+        with open("/sys/fs/cgroup/cpu.max", "r", encoding="utf-8") as f:
+            quota, period = f.read().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1: quota -1 significa sem limite
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "r", encoding="utf-8") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us", "r", encoding="utf-8") as f:
+            period = int(f.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# Um worker uvicorn por CPU disponível, limitado por MAX_WORKERS (sobrescreva com
+# WEB_CONCURRENCY). Cada worker abre seu próprio pool de conexões do Mongo
+# (MONGO_MAX_POOL_SIZE), então o total de conexões é workers × pool.
+if os.getenv("WEB_CONCURRENCY"):
+    workers = int(os.getenv("WEB_CONCURRENCY"))
+else:
+    workers = min(_available_cpus(), int(os.getenv("MAX_WORKERS", "8")))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Importa o app uma única vez no master e faz fork dos workers. É seguro porque
+# run.py não abre conexões no import: o cliente do Mongo e os caches são criados
+# no lifespan de cada worker, antes dele aceitar requisições.
+preload_app = True
+
+timeout = int(os.getenv("WORKER_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
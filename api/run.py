@@ -1,4 +1,7 @@
 import os
+import threading
+from contextlib import asynccontextmanager
+from time import monotonic
 from fastapi import FastAPI, HTTPException, Depends, Header
 import pymongo
 from bson import ObjectId
@@ -11,18 +14,97 @@ _user = os.getenv("DB_USERNAME")
 _password = os.getenv("DB_PASSWORD")
 _host = os.getenv("DB_HOST")
 
-print(f"DB_USER: {_user}, DB_HOST: {_host}")
+# Seconds each worker keeps age groups in memory before reading them again from Mongo
+AGE_GROUP_CACHE_TTL = float(os.getenv("AGE_GROUP_CACHE_TTL", "2"))
+# Server selection timeout for request traffic, kept below gunicorn's worker timeout
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+# Connection pool size per worker (pymongo's default is 100)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+# Seconds between warm-up attempts while Mongo is unreachable
+WARM_UP_RETRY_INTERVAL = float(os.getenv("WARM_UP_RETRY_INTERVAL", "2"))
+# Seconds a single warm-up attempt may take, so an unreachable Mongo delays startup only briefly
+WARM_UP_TIMEOUT = float(os.getenv("WARM_UP_TIMEOUT", "1"))
 
 # SETUP ================================================================
-app = FastAPI()
-client = pymongo.MongoClient(
-    f"mongodb://{_user}:{_password}@{_host}:27017/?authSource=admin&tlsAllowInvalidCertificates=true"
-)
+# The Mongo client is built in the lifespan (after each worker is forked),
+# never at import time, so a preloading master never shares its sockets.
+client: Optional[pymongo.MongoClient] = None
+enrollCollection = None
+ageGroupCollection = None
+messageCollection = None
+
+_ready = False
+_stop_warm_up = threading.Event()
+
+
+def _connect():
+    global client, enrollCollection, ageGroupCollection, messageCollection
+    print(f"[{os.getpid()}] DB_USER: {_user}, DB_HOST: {_host}")
+    client = pymongo.MongoClient(
+        f"mongodb://{_user}:{_password}@{_host}:27017/?authSource=admin&tlsAllowInvalidCertificates=true",
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+    )
+    enrollDatabase = client["enrollDatabase"]
+    enrollCollection = enrollDatabase["enrollCollection"]
+    ageGroupCollection = enrollDatabase["ageGroupCollection"]
+    messageCollection = enrollDatabase["messageCollection"]
+
+
+def _disconnect():
+    global client, enrollCollection, ageGroupCollection, messageCollection
+    if client is not None:
+        client.close()
+    client = None
+    enrollCollection = ageGroupCollection = messageCollection = None
+
+
+def _warm_up() -> bool:
+    global _ready
+    try:
+        _reload_credentials()
+        _invalidate_age_groups()
+        with pymongo.timeout(WARM_UP_TIMEOUT):
+            _load_age_groups()
+    except pymongo.errors.PyMongoError as e:
+        print(f"[{os.getpid()}] Warm-up failed: {e}")
+        return False
+    # Don't flip the flag if the lifespan is already shutting down
+    if _stop_warm_up.is_set():
+        return False
+    _ready = True
+    return True
+
+
+def _retry_warm_up():
+    while not _stop_warm_up.wait(WARM_UP_RETRY_INTERVAL):
+        if _warm_up():
+            return
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    global _ready
+    _connect()
+    _stop_warm_up.clear()
+    retry = None
+    # Warm the caches before this worker starts accepting requests. If Mongo is
+    # unreachable, serve anyway (like a lazy connection) and keep /ready at 503
+    # until a background retry succeeds.
+    if not _warm_up():
+        retry = threading.Thread(target=_retry_warm_up, daemon=True)
+        retry.start()
+    try:
+        yield
+    finally:
+        _stop_warm_up.set()
+        if retry is not None:
+            retry.join()
+        _ready = False
+        _disconnect()
 
-enrollDatabase = client["enrollDatabase"]
-enrollCollection = enrollDatabase["enrollCollection"]
-ageGroupCollection = enrollDatabase["ageGroupCollection"]
-messageCollection = enrollDatabase["messageCollection"]
+
+app = FastAPI(lifespan=lifespan)
 
 # SCHEMA ===============================================================
 from pydantic import BaseModel
@@ -72,7 +154,10 @@ class LoginDTO(BaseModel):
 AUTH_CREDENTIALS_FILE = os.path.join(os.path.dirname(__file__), "credentials.json")
 
 
-def _load_credentials() -> dict:
+_credentials: Optional[dict] = None
+
+
+def _read_credentials_file() -> dict:
     try:
         with open(AUTH_CREDENTIALS_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -80,6 +165,47 @@ def _load_credentials() -> dict:
         return {"users": []}
 
 
+def _reload_credentials() -> dict:
+    global _credentials
+    _credentials = _read_credentials_file()
+    return _credentials
+
+
+def _load_credentials() -> dict:
+    # Read once per worker; changes to the file require restarting the API
+    if _credentials is None:
+        return _reload_credentials()
+    return _credentials
+
+
+_age_groups: Optional[list] = None
+_age_groups_loaded_at = 0.0
+_age_groups_lock = threading.Lock()
+# Bumped on every invalidation so a reload that started before it is discarded
+_age_groups_generation = 0
+
+
+def _load_age_groups() -> list:
+    global _age_groups, _age_groups_loaded_at
+    with _age_groups_lock:
+        if _age_groups is not None and monotonic() - _age_groups_loaded_at <= AGE_GROUP_CACHE_TTL:
+            return _age_groups
+        generation = _age_groups_generation
+    age_groups = list(ageGroupCollection.find())
+    with _age_groups_lock:
+        if generation == _age_groups_generation:
+            _age_groups = age_groups
+            _age_groups_loaded_at = monotonic()
+    return age_groups
+
+
+def _invalidate_age_groups():
+    global _age_groups, _age_groups_generation
+    with _age_groups_lock:
+        _age_groups_generation += 1
+        _age_groups = None
+
+
 def _find_user(username: str, password: str) -> Optional[dict]:
     creds = _load_credentials()
     for u in creds.get("users", []):
@@ -118,6 +244,13 @@ def read_root():
     return {"Hello": "World"}
 
 
+@app.get("/ready")
+def readiness():
+    if not _ready:
+        raise HTTPException(status_code=503, detail="Not ready")
+    return {"status": "ready", "pid": os.getpid()}
+
+
 @app.get("/enroll/{enroll_id}")
 def get_enroll(enroll_id: str):
     try:
@@ -143,6 +276,7 @@ def list_enrolls():
 
 @app.post("/enroll")
 def create_enroll(enroll: EnrollCreateDTO):
+    # Always read from Mongo: the per-worker cache may miss writes made by other workers
     age_group = ageGroupCollection.find_one(
         {"min_age": {"$lte": enroll.age}, "max_age": {"$gte": enroll.age}}
     )
@@ -177,17 +311,15 @@ def update_enroll(enroll_id: str, enroll: EnrollUpdateDTO):
 
 @app.get("/age-groups")
 def list_age_groups():
-    age_groups = ageGroupCollection.find()
-    age_groups = list(age_groups)
-    # Convert ObjectId to string for JSON serialization
-    for age_group in age_groups:
-        age_group["_id"] = str(age_group["_id"])
+    # Copies from the cache, converting ObjectId to string for JSON serialization
+    age_groups = [{**age_group, "_id": str(age_group["_id"])} for age_group in _load_age_groups()]
     return {"age_groups": age_groups}
 
 
 @app.post("/age-groups")
 def create_age_group(age_group: AgeGroup, _=Depends(require_token)):
     ageGroupCollection.insert_one(age_group.model_dump())
+    _invalidate_age_groups()
     return age_group
 
 
@@ -199,6 +331,7 @@ def update_age_group(age_group_id: str, age_group: AgeGroup, _=Depends(require_t
         result = ageGroupCollection.update_one(
             {"_id": object_id}, {"$set": age_group.model_dump()}
         )
+        _invalidate_age_groups()
         return {
             "modified_count": result.modified_count,
             "matched_count": result.matched_count,
@@ -227,6 +360,7 @@ def delete_age_group(age_group_id: str, _=Depends(require_token)):
         # Convert string to ObjectId for MongoDB query
         object_id = ObjectId(age_group_id)
         result = ageGroupCollection.delete_one({"_id": object_id})
+        _invalidate_age_groups()
         if result.deleted_count == 1:
             return {"message": "Age group deleted successfully"}
         return {"error": "Age group not found"}, 404
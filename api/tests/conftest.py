@@ -21,21 +21,6 @@ pymongo.MongoClient = mongomock.MongoClient  # type: ignore[attr-defined]
 # importe sua FastAPI app
 from api.run import app  # ajuste se a app estiver em outro módulo
 
-# Garante isolamento entre testes limpando as coleções a cada teste
-@pytest.fixture(autouse=True)
-def _clear_db_between_tests():
-    # Como o app usa mongomock (patchado acima), podemos apagar tudo com delete_many
-    try:
-        from api import run as app_module
-
-        app_module.ageGroupCollection.delete_many({})
-        app_module.enrollCollection.delete_many({})
-        app_module.messageCollection.delete_many({})
-    except Exception:
-        # Em caso de qualquer problema, não impedir a execução do teste
-        pass
-
-
 @dataclass
 class _InsertOneResult:
     inserted_id: Any
@@ -156,7 +141,16 @@ def app_module(monkeypatch):
     return module
 
 
+# Garante isolamento entre testes limpando as coleções a cada teste. A limpeza
+# precisa acontecer depois do lifespan, que é quem cria o cliente do Mongo
+# (mongomock, patchado acima) e aquece o cache de age groups.
 @pytest.fixture()
 def client():
+    from api import run as app_module
+
     with TestClient(app) as c:
+        app_module.ageGroupCollection.delete_many({})
+        app_module.enrollCollection.delete_many({})
+        app_module.messageCollection.delete_many({})
+        app_module._invalidate_age_groups()
         yield c
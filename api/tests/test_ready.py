@@ -0,0 +1,80 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from api.run import app
+
+
+def test_ready_after_startup(client):
+    resp = client.get("/ready")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "ready"
+
+
+def test_not_ready_without_lifespan():
+    # Sem o "with", o TestClient não executa o lifespan (sem Mongo e sem caches)
+    resp = TestClient(app).get("/ready")
+    assert resp.status_code == 503
+    assert resp.json()["detail"] == "Not ready"
+
+
+def test_age_group_cache_is_invalidated_on_write(client):
+    token = client.post("/auth/login", json={"username": "admin", "password": "admin"}).json()["token"]
+    assert client.get("/age-groups").json() == {"age_groups": []}
+
+    client.post("/age-groups", json={"min_age": 0, "max_age": 99, "description": "all"}, headers={"X-Token": token})
+    assert len(client.get("/age-groups").json()["age_groups"]) == 1
+
+
+def test_enroll_sees_age_group_written_by_another_worker(client):
+    from api import run as app_module
+
+    # Aquece o cache e depois grava direto no Mongo, como faria outro worker
+    assert client.get("/age-groups").json() == {"age_groups": []}
+    app_module.ageGroupCollection.insert_one({"min_age": 0, "max_age": 99, "description": "all"})
+
+    resp = client.post("/enroll", json={"name": "Bob", "cpf": "98765432100", "age": 40})
+    assert resp.status_code == 200
+
+
+def test_reload_started_before_invalidation_is_discarded(client, monkeypatch):
+    from api import run as app_module
+
+    real_find = app_module.ageGroupCollection.find
+
+    def _find_with_concurrent_write():
+        docs = list(real_find())
+        # Um write termina (e invalida o cache) enquanto a leitura está em andamento
+        app_module._invalidate_age_groups()
+        return docs
+
+    app_module._invalidate_age_groups()
+    monkeypatch.setattr(app_module.ageGroupCollection, "find", _find_with_concurrent_write)
+    app_module._load_age_groups()
+    assert app_module._age_groups is None
+
+
+def test_ready_after_warm_up_retry(monkeypatch):
+    import pymongo.errors
+    from api import run as app_module
+
+    real_load = app_module._load_age_groups
+    attempts = []
+
+    def _flaky_load():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise pymongo.errors.ServerSelectionTimeoutError("mongo indisponível")
+        return real_load()
+
+    monkeypatch.setattr(app_module, "_load_age_groups", _flaky_load)
+    monkeypatch.setattr(app_module, "WARM_UP_RETRY_INTERVAL", 0.01)
+
+    with TestClient(app) as c:
+        # O worker sobe mesmo sem Mongo, mas só fica pronto depois do retry
+        deadline = time.monotonic() + 5
+        while c.get("/ready").status_code != 200:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    assert len(attempts) == 2
+    assert app_module._ready is False